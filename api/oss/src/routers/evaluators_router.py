@@ -65,7 +65,9 @@ async def evaluator_data_map(request: Request, payload: EvaluatorMappingInputInt
         EvaluatorMappingOutputInterface: the evaluator mapping output object
     """
 
-    mapped_outputs = await evaluators_service.map(mapping_input=payload)
+    mapped_outputs = await evaluators_service.map_evaluator_inputs(
+        mapping_input=payload
+    )
     return mapped_outputs
 
 
@@ -1,18 +1,28 @@
+import os
 import re
+import sys
 import json
+import pickle
 import asyncio
+import hashlib
 import litellm
 import logging
+import subprocess
 import traceback
-from typing import Any, Dict, Union
+from functools import lru_cache, partial, wraps
+from collections import deque, OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
 import httpx
 import numpy as np
 from openai import OpenAI, AsyncOpenAI
-from numpy._core._multiarray_umath import array
-from autoevals.ragas import Faithfulness, ContextRelevancy
 
-from oss.src.services.security import sandbox
+try:
+    from rapidfuzz.distance import Levenshtein
+except ImportError:  # pragma: no cover - optional C extension
+    Levenshtein = None
+
 from oss.src.models.shared_models import Error, Result
 from oss.src.models.api.evaluation_model import (
     EvaluatorInputInterface,
@@ -82,7 +92,7 @@ def validate_string_output(
     return final_output
 
 
-async def map(
+async def map_evaluator_inputs(
     mapping_input: EvaluatorMappingInputInterface,
 ) -> EvaluatorMappingOutputInterface:
     """
@@ -94,7 +104,7 @@ async def map(
 
     mapping_outputs = {}
     mapping_inputs = mapping_input.inputs
-    response_version = mapping_input.inputs.get("version")
+    response_version = mapping_inputs.get("version")
 
     trace = {}
     if response_version == "3.0":
@@ -104,13 +114,13 @@ async def map(
 
     trace = process_distributed_trace_into_trace_tree(
         trace=trace,
-        version=mapping_input.inputs.get("version"),
+        version=response_version,
     )
     for to_key, from_key in mapping_input.mapping.items():
         mapping_outputs[to_key] = get_field_value_from_trace_tree(
             trace,
             from_key,
-            version=mapping_input.inputs.get("version"),
+            version=response_version,
         )
     return {"outputs": mapping_outputs}
 
@@ -134,10 +144,8 @@ def get_correct_answer(
     correct_answer_key = settings_values.get("correct_answer_key")
     if correct_answer_key is None:
         raise ValueError("No correct answer keys provided.")
-    if isinstance(correct_answer_key, str) and correct_answer_key.startswith(
-        "testcase."
-    ):
-        correct_answer_key = correct_answer_key[len("testcase.") :]
+    if isinstance(correct_answer_key, str):
+        correct_answer_key = _resolve_correct_answer_key(correct_answer_key)
     if correct_answer_key not in data_point:
         raise ValueError(
             f"Correct answer column '{correct_answer_key}' not found in the test set."
@@ -145,6 +153,56 @@ def get_correct_answer(
     return data_point[correct_answer_key]
 
 
+@lru_cache(maxsize=128)
+def _resolve_correct_answer_key(correct_answer_key: str) -> str:
+    """
+    Normalize a configured correct-answer key to its test set column name.
+    Cached since the same settings are reused for every row of a batch run.
+    """
+
+    if correct_answer_key.startswith("testcase."):
+        return correct_answer_key[len("testcase.") :]
+    return correct_answer_key
+
+
+def _handle_evaluator_errors(message: str):
+    """
+    Shared error handling for auto_* evaluators: configuration errors
+    (ValueError) surface their own message, anything else is wrapped with the
+    evaluator's generic message and the formatted traceback.
+    """
+
+    # Bound here so the wrapper resolves them as closure cells rather than
+    # re-reading module globals on every evaluated row.
+    def decorator(fn, _Result=Result, _Error=Error, _format_exc=traceback.format_exc):
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except ValueError as e:
+                return _Result(
+                    type="error",
+                    value=None,
+                    error=_Error(
+                        message=str(e),
+                    ),
+                )
+            except Exception:  # pylint: disable=broad-except
+                return _Result(
+                    type="error",
+                    value=None,
+                    error=_Error(
+                        message=message,
+                        stacktrace=_format_exc(),
+                    ),
+                )
+
+        return wrapper
+
+    return decorator
+
+
+@_handle_evaluator_errors("Error during Auto Exact Match evaluation")
 async def auto_exact_match(
     inputs: Dict[str, Any],  # pylint: disable=unused-argument
     output: Union[str, Dict[str, Any]],
@@ -168,41 +226,32 @@ async def auto_exact_match(
         Result: A Result object containing the evaluation result.
     """
 
-    try:
-        output = validate_string_output("exact_match", output)
-        correct_answer = get_correct_answer(data_point, settings_values)
-        inputs = {"ground_truth": correct_answer, "prediction": output}
-        response = await exact_match(
-            input=EvaluatorInputInterface(**{"inputs": inputs})
-        )
-        result = Result(type="bool", value=response["outputs"]["success"])
-        return result
-    except ValueError as e:
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message=str(e),
-            ),
-        )
-    except Exception as e:  # pylint: disable=broad-except
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message="Error during Auto Exact Match evaluation",
-                stacktrace=str(traceback.format_exc()),
-            ),
-        )
+    output = validate_string_output("exact_match", output)
+    correct_answer = get_correct_answer(data_point, settings_values)
+    inputs = {"ground_truth": correct_answer, "prediction": output}
+    response = await exact_match(input=EvaluatorInputInterface.model_construct(**{"inputs": inputs}))
+    return Result(type="bool", value=response["outputs"]["success"])
 
 
 async def exact_match(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
     prediction = input.inputs.get("prediction", "")
     ground_truth = input.inputs.get("ground_truth", "")
-    success = True if prediction == ground_truth else False
+    # Identity and length pre-checks skip the character-wise comparison for
+    # the common all-equal / trivially-unequal cases
+    if prediction is ground_truth:
+        success = True
+    elif (
+        type(prediction) is str
+        and type(ground_truth) is str
+        and len(prediction) != len(ground_truth)
+    ):
+        success = False
+    else:
+        success = prediction == ground_truth
     return {"outputs": {"success": success}}
 
 
+@_handle_evaluator_errors("Error during Auto Regex evaluation")
 async def auto_regex_test(
     inputs: Dict[str, Any],  # pylint: disable=unused-argument
     output: Union[str, Dict[str, Any]],
@@ -211,28 +260,23 @@ async def auto_regex_test(
     settings_values: Dict[str, Any],
     lm_providers_keys: Dict[str, Any],  # pylint: disable=unused-argument
 ) -> Result:
-    try:
-        output = validate_string_output("regex_test", output)
-        inputs = {"ground_truth": data_point, "prediction": output}
-        response = await regex_test(
-            input=EvaluatorInputInterface(
-                **{"inputs": inputs, "settings": settings_values}
-            )
-        )
-        return Result(type="bool", value=response["outputs"]["success"])
-    except Exception as e:  # pylint: disable=broad-except
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message="Error during Auto Regex evaluation",
-                stacktrace=str(traceback.format_exc()),
-            ),
-        )
+    output = validate_string_output("regex_test", output)
+    inputs = {"ground_truth": data_point, "prediction": output}
+    response = await regex_test(
+        input=EvaluatorInputInterface.model_construct(**{"inputs": inputs, "settings": settings_values})
+    )
+    return Result(type="bool", value=response["outputs"]["success"])
+
+
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str, flags: int) -> re.Pattern:
+    """Compile a user-supplied pattern once and reuse it across rows."""
+
+    return re.compile(pattern, flags)
 
 
 async def regex_test(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
-    pattern = re.compile(input.settings["regex_pattern"], re.IGNORECASE)
+    pattern = _compile_regex(input.settings["regex_pattern"], re.IGNORECASE)
     result = (
         bool(pattern.search(input.inputs["prediction"]))
         == input.settings["regex_should_match"]
@@ -253,7 +297,7 @@ async def auto_field_match_test(
         correct_answer = get_correct_answer(data_point, settings_values)
         inputs = {"ground_truth": correct_answer, "prediction": output}
         response = await field_match_test(
-            input=EvaluatorInputInterface(**{"inputs": inputs})
+            input=EvaluatorInputInterface.model_construct(**{"inputs": inputs})
         )
         return Result(type="bool", value=response["outputs"]["success"])
     except ValueError as e:
@@ -270,8 +314,15 @@ async def auto_field_match_test(
 
 
 async def field_match_test(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
-    prediction_json = json.loads(input.inputs["prediction"])
-    result = prediction_json == input.inputs["ground_truth"]
+    prediction = input.inputs["prediction"]
+    ground_truth = input.inputs["ground_truth"]
+    # Skip the JSON parse when the prediction cannot possibly decode to the
+    # ground truth's container type
+    if isinstance(ground_truth, dict) and not prediction.lstrip().startswith("{"):
+        return {"outputs": {"success": False}}
+    if isinstance(ground_truth, list) and not prediction.lstrip().startswith("["):
+        return {"outputs": {"success": False}}
+    result = json.loads(prediction) == ground_truth
     return {"outputs": {"success": result}}
 
 
@@ -288,7 +339,7 @@ async def auto_webhook_test(
         correct_answer = get_correct_answer(data_point, settings_values)
         inputs = {"prediction": output, "ground_truth": correct_answer}
         response = await webhook_test(
-            input=EvaluatorInputInterface(
+            input=EvaluatorInputInterface.model_construct(
                 **{"inputs": inputs, "settings": settings_values}
             )
         )
@@ -322,20 +373,30 @@ async def auto_webhook_test(
         )
 
 
+# Shared client so batch webhook evaluations reuse pooled (keep-alive)
+# connections instead of paying a TCP+TLS handshake per row.
+_WEBHOOK_CLIENT = httpx.AsyncClient(
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=32),
+)
+
+
 async def webhook_test(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
-    with httpx.Client() as client:
-        payload = {
-            "correct_answer": input.inputs["ground_truth"],
-            "output": input.inputs["prediction"],
-            "inputs": input.inputs,
-        }
-        response = client.post(url=input.settings["webhook_url"], json=payload)
-        response.raise_for_status()
-        response_data = response.json()
-        score = response_data.get("score", None)
-        return {"outputs": {"score": score}}
+    payload = {
+        "correct_answer": input.inputs["ground_truth"],
+        "output": input.inputs["prediction"],
+        "inputs": input.inputs,
+    }
+    response = await _WEBHOOK_CLIENT.post(
+        url=input.settings["webhook_url"], json=payload
+    )
+    response.raise_for_status()
+    response_data = response.json()
+    score = response_data.get("score", None)
+    return {"outputs": {"score": score}}
 
 
+@_handle_evaluator_errors("Error during Auto Custom Code Evaluation")
 async def auto_custom_code_run(
     inputs: Dict[str, Any],
     output: Union[str, Dict[str, Any]],
@@ -344,39 +405,86 @@ async def auto_custom_code_run(
     settings_values: Dict[str, Any],
     lm_providers_keys: Dict[str, Any],  # pylint: disable=unused-argument
 ) -> Result:
-    try:
-        output = validate_string_output("custom_code_run", output)
-        correct_answer = get_correct_answer(data_point, settings_values)
-        inputs = {
-            "app_config": app_params,
-            "prediction": output,
-            "ground_truth": correct_answer,
-        }
-        response = await custom_code_run(
-            input=EvaluatorInputInterface(
-                **{"inputs": inputs, "settings": settings_values}
-            )
-        )
-        return Result(type="number", value=response["outputs"]["score"])
-    except Exception as e:  # pylint: disable=broad-except
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message="Error during Auto Custom Code Evaluation",
-                stacktrace=str(traceback.format_exc()),
-            ),
+    output = validate_string_output("custom_code_run", output)
+    correct_answer = get_correct_answer(data_point, settings_values)
+    inputs = {
+        "app_config": app_params,
+        "prediction": output,
+        "ground_truth": correct_answer,
+    }
+    response = await custom_code_run(
+        input=EvaluatorInputInterface.model_construct(**{"inputs": inputs, "settings": settings_values})
+    )
+    return Result(type="number", value=response["outputs"]["score"])
+
+
+# Per-row timeout so runaway user code cannot stall evaluation
+_SANDBOX_TIMEOUT_SECONDS = 60.0
+
+# Executed in a fresh interpreter per row. Keeps user code out of the worker
+# process and silences its stdout so only the pickled result comes back.
+_SANDBOX_RUNNER = """
+import os, pickle, sys
+out = sys.stdout.buffer
+sys.stdout = open(os.devnull, "w")
+from oss.src.services.security import sandbox
+kwargs = pickle.load(sys.stdin.buffer)
+try:
+    result = (True, sandbox.execute_code_safely(**kwargs))
+except Exception as exc:
+    result = (False, exc)
+out.write(pickle.dumps(result))
+out.flush()
+"""
+
+
+def _execute_code_in_subprocess(kwargs: Dict[str, Any], timeout: float):
+    """
+    Run sandbox.execute_code_safely in a dedicated subprocess.
+
+    Celery prefork workers are daemonic, so multiprocessing pools cannot
+    spawn children there; a plain subprocess can, still keeps the CPU-bound
+    RestrictedPython execution out of the worker process, and lets the
+    timeout genuinely kill runaway user code rather than abandoning it.
+    Exceptions raised inside the sandbox are re-raised here unchanged.
+    """
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    completed = subprocess.run(
+        [sys.executable, "-c", _SANDBOX_RUNNER],
+        input=pickle.dumps(kwargs),
+        capture_output=True,
+        timeout=timeout,
+        env=env,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"Sandbox process exited with code {completed.returncode}: "
+            f"{completed.stderr.decode(errors='replace').strip()}"
         )
+    succeeded, payload = pickle.loads(completed.stdout)
+    if not succeeded:
+        raise payload
+    return payload
 
 
 async def custom_code_run(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
-    result = sandbox.execute_code_safely(
-        app_params=input.inputs["app_config"],
-        inputs=input.inputs,
-        output=input.inputs["prediction"],
-        correct_answer=input.inputs["ground_truth"],
-        code=input.settings["code"],
-        datapoint=input.inputs["ground_truth"],
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(
+        None,
+        partial(
+            _execute_code_in_subprocess,
+            dict(
+                app_params=input.inputs["app_config"],
+                inputs=input.inputs,
+                output=input.inputs["prediction"],
+                correct_answer=input.inputs["ground_truth"],
+                code=input.settings["code"],
+                datapoint=input.inputs["ground_truth"],
+            ),
+            _SANDBOX_TIMEOUT_SECONDS,
+        ),
     )
     return {"outputs": {"score": result}}
 
@@ -418,7 +526,7 @@ async def auto_ai_critique(
             "model": settings_values.get("model", ""),
         }
         response = await ai_critique(
-            input=EvaluatorInputInterface(
+            input=EvaluatorInputInterface.model_construct(
                 **{
                     "inputs": inputs,
                     "settings": settings,
@@ -433,11 +541,18 @@ async def auto_ai_critique(
             value=None,
             error=Error(
                 message="Error during Auto AI Critique",
-                stacktrace=str(traceback.format_exc()),
+                stacktrace=traceback.format_exc(),
             ),
         )
 
 
+@lru_cache(maxsize=8)
+def _async_openai_client(api_key: str) -> AsyncOpenAI:
+    """Reuse one AsyncOpenAI client (and its connection pool) per API key."""
+
+    return AsyncOpenAI(api_key=api_key)
+
+
 async def ai_critique(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
     openai_api_key = input.credentials.get("OPENAI_API_KEY", None)
     anthropic_api_key = input.credentials.get("ANTHROPIC_API_KEY", None)
@@ -488,7 +603,7 @@ async def ai_critique(input: EvaluatorInputInterface) -> EvaluatorOutputInterfac
             {"role": "system", "content": prompt_template},
             {"role": "user", "content": str(chain_run_args)},
         ]
-        client = AsyncOpenAI(api_key=openai_api_key)
+        client = _async_openai_client(openai_api_key)
         response = await client.chat.completions.create(
             model="gpt-3.5-turbo", messages=messages, temperature=0.8
         )
@@ -496,6 +611,7 @@ async def ai_critique(input: EvaluatorInputInterface) -> EvaluatorOutputInterfac
     return {"outputs": {"score": evaluation_output}}
 
 
+@_handle_evaluator_errors("Error during Starts With evaluation")
 async def auto_starts_with(
     inputs: Dict[str, Any],  # pylint: disable=unused-argument
     output: Union[str, Dict[str, Any]],
@@ -504,39 +620,34 @@ async def auto_starts_with(
     settings_values: Dict[str, Any],
     lm_providers_keys: Dict[str, Any],  # pylint: disable=unused-argument
 ) -> Result:
-    try:
-        output = validate_string_output("starts_with", output)
-        inputs = {"prediction": output}
-        response = await starts_with(
-            input=EvaluatorInputInterface(
-                **{"inputs": inputs, "settings": settings_values}
-            )
-        )
-        return Result(type="text", value=response["outputs"]["success"])
-    except Exception as e:  # pylint: disable=broad-except
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message="Error during Starts With evaluation",
-                stacktrace=str(traceback.format_exc()),
-            ),
-        )
+    output = validate_string_output("starts_with", output)
+    inputs = {"prediction": output}
+    response = await starts_with(
+        input=EvaluatorInputInterface.model_construct(**{"inputs": inputs, "settings": settings_values})
+    )
+    return Result(type="text", value=response["outputs"]["success"])
 
 
-async def starts_with(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
-    prefix = input.settings.get("prefix", "")
-    case_sensitive = input.settings.get("case_sensitive", True)
+def _fold_case(haystack: str, needle: str, case_sensitive: bool) -> tuple:
+    """Lower both sides exactly once for case-insensitive comparisons."""
+
+    if case_sensitive:
+        return haystack, needle
+    return haystack.lower(), needle.lower()
 
-    output = str(input.inputs["prediction"])
-    if not case_sensitive:
-        output = output.lower()
-        prefix = prefix.lower()
+
+async def starts_with(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
+    output, prefix = _fold_case(
+        str(input.inputs["prediction"]),
+        input.settings.get("prefix", ""),
+        input.settings.get("case_sensitive", True),
+    )
 
     result = output.startswith(prefix)
     return {"outputs": {"success": result}}
 
 
+@_handle_evaluator_errors("Error during Ends With evaluation")
 async def auto_ends_with(
     inputs: Dict[str, Any],  # pylint: disable=unused-argument
     output: Union[str, Dict[str, Any]],
@@ -545,40 +656,26 @@ async def auto_ends_with(
     settings_values: Dict[str, Any],
     lm_providers_keys: Dict[str, Any],  # pylint: disable=unused-argument
 ) -> Result:
-    try:
-        output = validate_string_output("ends_with", output)
-        inputs = {"prediction": output}
-        response = await ends_with(
-            input=EvaluatorInputInterface(
-                **{"inputs": inputs, "settings": settings_values}
-            )
-        )
-        result = Result(type="bool", value=response["outputs"]["success"])
-        return result
-    except Exception as e:  # pylint: disable=broad-except
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message="Error during Ends With evaluation",
-                stacktrace=str(traceback.format_exc()),
-            ),
-        )
+    output = validate_string_output("ends_with", output)
+    inputs = {"prediction": output}
+    response = await ends_with(
+        input=EvaluatorInputInterface.model_construct(**{"inputs": inputs, "settings": settings_values})
+    )
+    return Result(type="bool", value=response["outputs"]["success"])
 
 
 async def ends_with(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
-    suffix = input.settings.get("suffix", "")
-    case_sensitive = input.settings.get("case_sensitive", True)
-
-    output = str(input.inputs["prediction"])
-    if not case_sensitive:
-        output = output.lower()
-        suffix = suffix.lower()
+    output, suffix = _fold_case(
+        str(input.inputs["prediction"]),
+        input.settings.get("suffix", ""),
+        input.settings.get("case_sensitive", True),
+    )
 
     result = output.endswith(suffix)
     return {"outputs": {"success": result}}
 
 
+@_handle_evaluator_errors("Error during Contains evaluation")
 async def auto_contains(
     inputs: Dict[str, Any],  # pylint: disable=unused-argument
     output: Union[str, Dict[str, Any]],
@@ -587,40 +684,26 @@ async def auto_contains(
     settings_values: Dict[str, Any],
     lm_providers_keys: Dict[str, Any],  # pylint: disable=unused-argument
 ) -> Result:
-    try:
-        output = validate_string_output("contains", output)
-        inputs = {"prediction": output}
-        response = await contains(
-            input=EvaluatorInputInterface(
-                **{"inputs": inputs, "settings": settings_values}
-            )
-        )
-        result = Result(type="bool", value=response["outputs"]["success"])
-        return result
-    except Exception as e:  # pylint: disable=broad-except
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message="Error during Contains evaluation",
-                stacktrace=str(traceback.format_exc()),
-            ),
-        )
+    output = validate_string_output("contains", output)
+    inputs = {"prediction": output}
+    response = await contains(
+        input=EvaluatorInputInterface.model_construct(**{"inputs": inputs, "settings": settings_values})
+    )
+    return Result(type="bool", value=response["outputs"]["success"])
 
 
 async def contains(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
-    substring = input.settings.get("substring", "")
-    case_sensitive = input.settings.get("case_sensitive", True)
-
-    output = str(input.inputs["prediction"])
-    if not case_sensitive:
-        output = output.lower()
-        substring = substring.lower()
+    output, substring = _fold_case(
+        str(input.inputs["prediction"]),
+        input.settings.get("substring", ""),
+        input.settings.get("case_sensitive", True),
+    )
 
     result = substring in output
     return {"outputs": {"success": result}}
 
 
+@_handle_evaluator_errors("Error during Contains Any evaluation")
 async def auto_contains_any(
     inputs: Dict[str, Any],  # pylint: disable=unused-argument
     output: Union[str, Dict[str, Any]],
@@ -629,42 +712,50 @@ async def auto_contains_any(
     settings_values: Dict[str, Any],
     lm_providers_keys: Dict[str, Any],  # pylint: disable=unused-argument
 ) -> Result:
-    try:
-        output = validate_string_output("contains_any", output)
-        inputs = {"prediction": output}
-        response = await contains_any(
-            input=EvaluatorInputInterface(
-                **{"inputs": inputs, "settings": settings_values}
-            )
-        )
-        result = Result(type="bool", value=response["outputs"]["success"])
-        return result
-    except Exception as e:  # pylint: disable=broad-except
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message="Error during Contains Any evaluation",
-                stacktrace=str(traceback.format_exc()),
-            ),
-        )
+    output = validate_string_output("contains_any", output)
+    inputs = {"prediction": output}
+    response = await contains_any(
+        input=EvaluatorInputInterface.model_construct(**{"inputs": inputs, "settings": settings_values})
+    )
+    return Result(type="bool", value=response["outputs"]["success"])
 
 
-async def contains_any(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
-    substrings_str = input.settings.get("substrings", "")
+@lru_cache(maxsize=128)
+def _parse_substrings(
+    substrings_str: str, case_sensitive: bool, longest_first: bool = False
+) -> tuple:
+    """
+    Split and normalize a comma-separated substrings setting once per
+    configuration, so per-row calls only pay for the scan of the output.
+
+    With longest_first, needles are ordered by descending length so the scans
+    most likely to fail run first, letting all(...) reject early.
+    """
+
     substrings = [substring.strip() for substring in substrings_str.split(",")]
+    if not case_sensitive:
+        substrings = [substring.lower() for substring in substrings]
+    if longest_first:
+        substrings.sort(key=len, reverse=True)
+    return tuple(substrings)
+
+
+async def contains_any(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
     case_sensitive = input.settings.get("case_sensitive", True)
+    substrings = _parse_substrings(
+        input.settings.get("substrings", ""), case_sensitive
+    )
 
     output = str(input.inputs["prediction"])
     if not case_sensitive:
         output = output.lower()
-        substrings = [substring.lower() for substring in substrings]
 
     return {
         "outputs": {"success": any(substring in output for substring in substrings)}
     }
 
 
+@_handle_evaluator_errors("Error during Contains All evaluation")
 async def auto_contains_all(
     inputs: Dict[str, Any],  # pylint: disable=unused-argument
     output: Union[str, Dict[str, Any]],
@@ -673,40 +764,30 @@ async def auto_contains_all(
     settings_values: Dict[str, Any],
     lm_providers_keys: Dict[str, Any],  # pylint: disable=unused-argument
 ) -> Result:
-    try:
-        output = validate_string_output("contains_all", output)
-        response = await contains_all(
-            input=EvaluatorInputInterface(
-                **{"inputs": {"prediction": output}, "settings": settings_values}
-            )
-        )
-        result = Result(type="bool", value=response["outputs"]["success"])
-        return result
-    except Exception as e:  # pylint: disable=broad-except
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message="Error during Contains All evaluation",
-                stacktrace=str(traceback.format_exc()),
-            ),
+    output = validate_string_output("contains_all", output)
+    response = await contains_all(
+        input=EvaluatorInputInterface.model_construct(
+            **{"inputs": {"prediction": output}, "settings": settings_values}
         )
+    )
+    return Result(type="bool", value=response["outputs"]["success"])
 
 
 async def contains_all(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
-    substrings_str = input.settings.get("substrings", "")
-    substrings = [substring.strip() for substring in substrings_str.split(",")]
     case_sensitive = input.settings.get("case_sensitive", True)
+    substrings = _parse_substrings(
+        input.settings.get("substrings", ""), case_sensitive, longest_first=True
+    )
 
     output = str(input.inputs["prediction"])
     if not case_sensitive:
         output = output.lower()
-        substrings = [substring.lower() for substring in substrings]
 
     result = all(substring in output for substring in substrings)
     return {"outputs": {"success": result}}
 
 
+@_handle_evaluator_errors("Error during Contains JSON evaluation")
 async def auto_contains_json(
     inputs: Dict[str, Any],  # pylint: disable=unused-argument
     output: Union[str, Dict[str, Any]],
@@ -715,48 +796,114 @@ async def auto_contains_json(
     settings_values: Dict[str, Any],  # pylint: disable=unused-argument
     lm_providers_keys: Dict[str, Any],  # pylint: disable=unused-argument
 ) -> Result:
-    try:
-        # parsing llm app output format if v2
-        output = output.get("data", "") if isinstance(output, dict) else output
-        if isinstance(output, dict):
-            output = json.dumps(
-                output
-            )  # contains_json expects inputs.prediction to be a string
-        elif not isinstance(output, (str, dict)):
-            raise Exception(
-                f"Evaluator contains_json requires the app output to be either a JSON string or object, but received {type(output).__name__} instead."
-            )
-        response = await contains_json(
-            input=EvaluatorInputInterface(**{"inputs": {"prediction": output}})
-        )
-        return Result(type="bool", value=response["outputs"]["success"])
-    except Exception as e:  # pylint: disable=broad-except
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message="Error during Contains JSON evaluation",
-                stacktrace=str(traceback.format_exc()),
-            ),
+    # parsing llm app output format if v2
+    output = output.get("data", "") if isinstance(output, dict) else output
+    if isinstance(output, dict):
+        output = json.dumps(
+            output
+        )  # contains_json expects inputs.prediction to be a string
+    elif not isinstance(output, (str, dict)):
+        raise Exception(
+            f"Evaluator contains_json requires the app output to be either a JSON string or object, but received {type(output).__name__} instead."
         )
+    response = await contains_json(
+        input=EvaluatorInputInterface.model_construct(**{"inputs": {"prediction": output}})
+    )
+    return Result(type="bool", value=response["outputs"]["success"])
+
+
+def _find_balanced_json(text: str) -> bool:
+    """
+    Scan `text` once for a balanced {...} candidate, tracking brace depth and
+    string/escape state, and validate only the candidate with json.loads.
+    This keeps the parse bounded by the size of the JSON blob instead of
+    feeding everything between the first '{' and the last '}' to the parser.
+    """
+
+    depth = 0
+    in_string = False
+    escape = False
+    start = -1
+
+    for index, char in enumerate(text):
+        if start == -1:
+            if char == "{":
+                start = index
+                depth = 1
+            continue
+
+        if escape:
+            escape = False
+            continue
+        if in_string:
+            if char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                try:
+                    json.loads(text[start : index + 1])
+                    return True
+                except json.JSONDecodeError:
+                    # Not valid JSON after all; keep scanning after it
+                    start = -1
+                    in_string = False
+                    escape = False
+
+    return False
 
 
 async def contains_json(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
-    try:
-        start_index = str(input.inputs["prediction"]).index("{")
-        end_index = str(input.inputs["prediction"]).rindex("}") + 1
-        potential_json = str(input.inputs["prediction"])[start_index:end_index]
-        json.loads(potential_json)
-        contains_json = True
-    except (ValueError, json.JSONDecodeError) as e:
-        contains_json = False
+    prediction = str(input.inputs["prediction"])
+    return {"outputs": {"success": _find_balanced_json(prediction)}}
+
+
+def iter_flatten_json(json_obj: Union[list, dict]) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (path, value) pairs for every leaf of a (nested) JSON object, where
+    each path encodes the position of the value in the original structure.
+    Iterative with an explicit stack, so deeply nested payloads do not pay a
+    Python frame per level, and callers can consume the pairs without
+    materializing an intermediate dictionary.
+
+    Args:
+        json_obj (Union[list, dict]): The (nested) JSON object to flatten. It can be either a dictionary or a list.
+
+    Yields:
+        Tuple[str, Any]: (path, leaf value) pairs.
+    """
+
+    if type(json_obj) is not dict and type(json_obj) is not list:
+        return
 
-    return {"outputs": {"success": contains_json}}
+    stack = deque([(json_obj, "")])
+
+    while stack:
+        obj, path = stack.pop()
+        if type(obj) is dict:
+            items = obj.items()
+        else:  # list
+            items = enumerate(obj)
+
+        for key, value in items:
+            new_key = f"{path}.{key}" if path else str(key)
+            if type(value) is dict or type(value) is list:
+                stack.append((value, new_key))
+            else:
+                yield new_key, value
 
 
 def flatten_json(json_obj: Union[list, dict]) -> Dict[str, Any]:
     """
-    This function takes a (nested) JSON object and flattens it into a single-level dictionary where each key represents the path to the value in the original JSON structure. This is done recursively, ensuring that the full hierarchical context is preserved in the keys.
+    This function takes a (nested) JSON object and flattens it into a single-level dictionary where each key represents the path to the value in the original JSON structure.
 
     Args:
         json_obj (Union[list, dict]): The (nested) JSON object to flatten. It can be either a dictionary or a list.
@@ -765,27 +912,74 @@ def flatten_json(json_obj: Union[list, dict]) -> Dict[str, Any]:
         Dict[str, Any]: The flattened JSON object as a dictionary, with keys representing the paths to the values in the original structure.
     """
 
-    output = {}
-
-    def flatten(obj: Union[list, dict], path: str = "") -> None:
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                new_key = f"{path}.{key}" if path else key
-                if isinstance(value, (dict, list)):
-                    flatten(value, new_key)
-                else:
-                    output[new_key] = value
-
-        elif isinstance(obj, list):
-            for index, value in enumerate(obj):
-                new_key = f"{path}.{index}" if path else str(index)
-                if isinstance(value, (dict, list)):
-                    flatten(value, new_key)
-                else:
-                    output[new_key] = value
-
-    flatten(json_obj)
-    return output
+    return dict(iter_flatten_json(json_obj))
+
+
+# Below this many common keys the numpy round-trip costs more than the loop
+_VECTORIZE_MIN_KEYS = 64
+
+# Below this many common keys the plain loop beats compiling a comparator
+_CODEGEN_MIN_KEYS = 8
+
+
+@lru_cache(maxsize=128)
+def _make_comparator(keys: tuple, compare_schema_only: bool):
+    """
+    Compile a comparator specialized to a fixed set of flattened keys.
+
+    Evaluation runs apply json_diff to many rows with the same schema, so the
+    generated straight-line function (cached per key set) replaces the
+    interpreted per-key loop and its dict.get dispatch from the second row on.
+    """
+
+    lines = ["def compare(gt, ao):", "    score = 0.0"]
+    for key in keys:
+        lines.append(f"    v = gt[{key!r}]; w = ao[{key!r}]")
+        if compare_schema_only:
+            lines.append(
+                "    if v is not None and w is not None and type(v) is type(w):"
+            )
+        else:
+            lines.append("    if v is not None and v == w:")
+        lines.append("        score += 1.0")
+    lines.append("    return score")
+
+    namespace = {}
+    exec(  # pylint: disable=exec-used
+        compile("\n".join(lines), "<json_diff_comparator>", "exec"), namespace
+    )
+    return namespace["compare"]
+
+
+def _score_common_keys_vectorized(
+    flattened_ground_truth: Dict[str, Any],
+    flattened_app_output: Dict[str, Any],
+    common_keys: set,
+    compare_schema_only: bool,
+) -> float:
+    """
+    Score the common keys of two flattened JSON objects with a single
+    vectorized comparison instead of a per-key Python loop. Only worthwhile
+    for large flat schemas.
+    """
+
+    gt_values = np.array(
+        [flattened_ground_truth[key] for key in common_keys], dtype=object
+    )
+    ao_values = np.array(
+        [flattened_app_output[key] for key in common_keys], dtype=object
+    )
+
+    present = (gt_values != None) & (ao_values != None)  # noqa: E711
+
+    if compare_schema_only:
+        gt_types = np.array([type(value) for value in gt_values], dtype=object)
+        ao_types = np.array([type(value) for value in ao_values], dtype=object)
+        matches = present & (gt_types == ao_types)
+    else:
+        matches = present & (gt_values == ao_values)
+
+    return float(np.count_nonzero(matches))
 
 
 def compare_jsons(
@@ -810,51 +1004,91 @@ def compare_jsons(
             return d
         return {k.lower(): v for k, v in d.items()}
 
-    def diff(ground_truth: Any, app_output: Any, compare_schema_only: bool) -> float:
-        gt_key, gt_value = next(iter(ground_truth.items()))
-        ao_key, ao_value = next(iter(app_output.items()))
+    compare_schema_only = settings_values.get("compare_schema_only", False)
+    case_insensitive_keys = settings_values.get("case_insensitive_keys", False)
 
-        if compare_schema_only:
-            return (
-                1.0 if (gt_key == ao_key and type(gt_value) == type(ao_value)) else 0.0
-            )
-        return 1.0 if (gt_key == ao_key and gt_value == ao_value) else 0.0
+    flattened_ground_truth = normalize_keys(
+        flatten_json(ground_truth), case_insensitive_keys
+    )
 
-    flattened_ground_truth = flatten_json(ground_truth)
-    flattened_app_output = flatten_json(app_output)
+    if not settings_values.get("predict_keys", False):
+        # Only ground-truth keys count; stream the app output's leaves against
+        # them instead of materializing a second flattened dict.
+        no_of_keys = len(flattened_ground_truth)
+        if no_of_keys == 0:
+            return 0.0
+
+        # Each ground-truth key can score at most once. Case folding can
+        # collide several app-output keys onto one ground-truth key, so keep
+        # the last colliding leaf (as a materialized flatten would) and score
+        # afterwards; this stays bounded by the ground-truth key count.
+        matched_values: Dict[str, Any] = {}
+        for key, value in iter_flatten_json(app_output):
+            if case_insensitive_keys:
+                key = key.lower()
+            if key in flattened_ground_truth:
+                matched_values[key] = value
+
+        cumulated_score = 0.0
+        for key, value in matched_values.items():
+            if value is None:
+                continue
+            ground_truth_value = flattened_ground_truth[key]
+            if ground_truth_value is None:
+                continue
+            if compare_schema_only:
+                if type(ground_truth_value) is type(value):
+                    cumulated_score += 1.0
+            elif ground_truth_value == value:
+                cumulated_score += 1.0
+
+        return cumulated_score / no_of_keys
+
+    # predict_keys: unmatched app-output keys penalize the score, so both
+    # keyspaces are needed.
+    flattened_app_output = normalize_keys(
+        flatten_json(app_output), case_insensitive_keys
+    )
 
-    keys = flattened_ground_truth.keys()
-    if settings_values.get("predict_keys", False):
-        keys = set(keys).union(flattened_app_output.keys())
+    ground_truth_keys = flattened_ground_truth.keys()
+    app_output_keys = flattened_app_output.keys()
 
-    cumulated_score = 0.0
-    no_of_keys = len(keys)
+    no_of_keys = len(ground_truth_keys | app_output_keys)
+    if no_of_keys == 0:
+        return 0.0
 
-    compare_schema_only = settings_values.get("compare_schema_only", False)
-    case_insensitive_keys = settings_values.get("case_insensitive_keys", False)
-    flattened_ground_truth = normalize_keys(
-        flattened_ground_truth, case_insensitive_keys
-    )
-    flattened_app_output = normalize_keys(flattened_app_output, case_insensitive_keys)
+    # Only keys present (with a value) on both sides can score; everything
+    # else contributes 0, so there is no need to visit it.
+    common_keys = ground_truth_keys & app_output_keys
 
-    for key in keys:
-        ground_truth_value = flattened_ground_truth.get(key, None)
-        llm_app_output_value = flattened_app_output.get(key, None)
-
-        key_score = 0.0
-        if ground_truth_value is not None and llm_app_output_value is not None:
-            key_score = diff(
-                {key: ground_truth_value},
-                {key: llm_app_output_value},
-                compare_schema_only,
-            )
+    if len(common_keys) >= _VECTORIZE_MIN_KEYS:
+        cumulated_score = _score_common_keys_vectorized(
+            flattened_ground_truth,
+            flattened_app_output,
+            common_keys,
+            compare_schema_only,
+        )
+    elif len(common_keys) >= _CODEGEN_MIN_KEYS:
+        # Sorted so rows sharing a schema hit the same cached comparator
+        comparator = _make_comparator(tuple(sorted(common_keys)), compare_schema_only)
+        cumulated_score = comparator(flattened_ground_truth, flattened_app_output)
+    elif compare_schema_only:
+        cumulated_score = sum(
+            1.0
+            for key in common_keys
+            if flattened_ground_truth[key] is not None
+            and flattened_app_output[key] is not None
+            and type(flattened_ground_truth[key]) is type(flattened_app_output[key])
+        )
+    else:
+        cumulated_score = sum(
+            1.0
+            for key in common_keys
+            if flattened_ground_truth[key] is not None
+            and flattened_ground_truth[key] == flattened_app_output[key]
+        )
 
-        cumulated_score += key_score
-    try:
-        average_score = cumulated_score / no_of_keys
-        return average_score
-    except ZeroDivisionError:
-        return 0.0
+    return cumulated_score / no_of_keys
 
 
 async def auto_json_diff(
@@ -870,7 +1104,7 @@ async def auto_json_diff(
         correct_answer = get_correct_answer(data_point, settings_values)
 
         response = await json_diff(
-            input=EvaluatorInputInterface(
+            input=EvaluatorInputInterface.model_construct(
                 **{
                     "inputs": {"prediction": output, "ground_truth": correct_answer},
                     "settings": settings_values,
@@ -927,6 +1161,32 @@ async def json_diff(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
     return {"outputs": {"score": score}}
 
 
+@lru_cache(maxsize=8)
+def _faithfulness_evaluator(openai_api_key: str):
+    """
+    One Faithfulness instance (and its underlying OpenAI client) per API key,
+    shared across all rows of a batch run.
+    """
+
+    # Imported lazily since autoevals pulls in a heavy dependency tree
+    # that only these two RAG evaluators need
+    from autoevals.ragas import Faithfulness
+
+    return Faithfulness(api_key=openai_api_key)
+
+
+@lru_cache(maxsize=8)
+def _context_relevancy_evaluator(openai_api_key: str):
+    """
+    One ContextRelevancy instance per API key, shared across all rows of a
+    batch run.
+    """
+
+    from autoevals.ragas import ContextRelevancy
+
+    return ContextRelevancy(api_key=openai_api_key)
+
+
 async def measure_rag_consistency(
     input: EvaluatorInputInterface,
 ) -> EvaluatorOutputInterface:
@@ -936,8 +1196,7 @@ async def measure_rag_consistency(
             "No OpenAI key was found. RAG evaluator requires a valid OpenAI API key to function. Please configure your OpenAI API and try again."
         )
 
-    # Initialize RAG evaluator to calculate faithfulness score
-    faithfulness = Faithfulness(api_key=openai_api_key)
+    faithfulness = _faithfulness_evaluator(openai_api_key)
     eval_score = await faithfulness._run_eval_async(
         output=input.inputs["answer_key"],
         input=input.inputs["question_key"],
@@ -946,76 +1205,97 @@ async def measure_rag_consistency(
     return {"outputs": {"score": eval_score.score}}
 
 
-async def rag_faithfulness(
-    inputs: Dict[str, Any],  # pylint: disable=unused-argument
-    output: Union[str, Dict[str, Any]],
-    data_point: Dict[str, Any],  # pylint: disable=unused-argument
-    app_params: Dict[str, Any],  # pylint: disable=unused-argument
-    settings_values: Dict[str, Any],  # pylint: disable=unused-argument
-    lm_providers_keys: Dict[str, Any],  # pylint: disable=unused-argument
-) -> Result:
-    try:
-        if isinstance(output, str):
-            logging.error("'output' is most likely not BaseResponse.")
-            raise NotImplementedError(
-                "Please update the SDK to the latest version, which supports RAG evaluators."
-            )
+# Mapping keys every RAG evaluator needs, in unpack order.
+_RAG_KEYS = ("question_key", "answer_key", "contexts_key")
 
-        # Get required keys for rag evaluator
-        mapping_keys = remove_trace_prefix(settings_values=settings_values)
-        question_key: Union[str, None] = mapping_keys.get("question_key", None)
-        answer_key: Union[str, None] = mapping_keys.get("answer_key", None)
-        contexts_key: Union[str, None] = mapping_keys.get("contexts_key", None)
 
-        if None in [question_key, answer_key, contexts_key]:
-            logging.error(
-                f"Missing evaluator settings ? {['question', question_key is None, 'answer', answer_key is None, 'context', contexts_key is None]}"
-            )
-            raise ValueError(
-                "Missing required configuration keys: 'question_key', 'answer_key', or 'contexts_key'. Please check your evaluator settings and try again."
-            )
+def _extract_rag_fields(
+    output: Union[str, Dict[str, Any]],
+    settings_values: Dict[str, Any],
+) -> Tuple[Any, Any, Any]:
+    """
+    Shared front half of the RAG evaluators: resolve the configured mapping
+    keys, build the trace tree once, and read the question, answer and
+    contexts values from that one tree. Raises for the evaluator wrappers to
+    surface as error Results.
+    """
 
-        # Turn distributed trace into trace tree
-        trace = {}
-        version = output.get("version")
-        if version == "3.0":
-            trace = output.get("tree", {})
-        elif version == "2.0":
-            trace = output.get("trace", {})
+    if isinstance(output, str):
+        logger.error("'output' is most likely not BaseResponse.")
+        raise NotImplementedError(
+            "Please update the SDK to the latest version, which supports RAG evaluators."
+        )
 
-        trace = process_distributed_trace_into_trace_tree(trace, version)
+    # Get required keys for rag evaluator
+    mapping_keys = remove_trace_prefix(settings_values=settings_values)
+    question_key, answer_key, contexts_key = [
+        mapping_keys.get(key) for key in _RAG_KEYS
+    ]
 
-        # Get value of required keys for rag evaluator
-        question_val: Any = get_field_value_from_trace_tree(
-            trace, question_key, version
-        )
-        answer_val: Any = get_field_value_from_trace_tree(trace, answer_key, version)
-        contexts_val: Any = get_field_value_from_trace_tree(
-            trace, contexts_key, version
+    if question_key is None or answer_key is None or contexts_key is None:
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                f"Missing evaluator settings ? {['question', question_key is None, 'answer', answer_key is None, 'context', contexts_key is None]}"
+            )
+        raise ValueError(
+            "Missing required configuration keys: 'question_key', 'answer_key', or 'contexts_key'. Please check your evaluator settings and try again."
         )
 
-        if None in [question_val, answer_val, contexts_val]:
-            logging.error(
+    # Turn distributed trace into trace tree
+    trace = {}
+    version = output.get("version")
+    if version == "3.0":
+        trace = output.get("tree", {})
+    elif version == "2.0":
+        trace = output.get("trace", {})
+
+    trace = process_distributed_trace_into_trace_tree(trace, version)
+
+    # Get value of required keys for rag evaluator
+    question_val, answer_val, contexts_val = (
+        get_field_value_from_trace_tree(trace, key, version)
+        for key in (question_key, answer_key, contexts_key)
+    )
+
+    if question_val is None or answer_val is None or contexts_val is None:
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
                 f"Missing trace field ? {['question', question_val is None, 'answer', answer_val is None, 'context', contexts_val is None]}"
             )
 
-            message = ""
-            if question_val is None:
-                message += (
-                    f"'question_key' is set to {question_key} which can't be found. "
-                )
-            if answer_val is None:
-                message += f"'answer_key' is set to {answer_key} which can't be found. "
-            if contexts_val is None:
-                message += (
-                    f"'contexts_key' is set to {contexts_key} which can't be found. "
-                )
-            message += "Please check your evaluator settings and try again."
+        message = ""
+        if question_val is None:
+            message += (
+                f"'question_key' is set to {question_key} which can't be found. "
+            )
+        if answer_val is None:
+            message += f"'answer_key' is set to {answer_key} which can't be found. "
+        if contexts_val is None:
+            message += (
+                f"'contexts_key' is set to {contexts_key} which can't be found. "
+            )
+        message += "Please check your evaluator settings and try again."
+
+        raise ValueError(message)
+
+    return question_val, answer_val, contexts_val
 
-            raise ValueError(message)
+
+async def rag_faithfulness(
+    inputs: Dict[str, Any],  # pylint: disable=unused-argument
+    output: Union[str, Dict[str, Any]],
+    data_point: Dict[str, Any],  # pylint: disable=unused-argument
+    app_params: Dict[str, Any],  # pylint: disable=unused-argument
+    settings_values: Dict[str, Any],  # pylint: disable=unused-argument
+    lm_providers_keys: Dict[str, Any],  # pylint: disable=unused-argument
+) -> Result:
+    try:
+        question_val, answer_val, contexts_val = _extract_rag_fields(
+            output, settings_values
+        )
 
         measurement = await measure_rag_consistency(
-            input=EvaluatorInputInterface(
+            input=EvaluatorInputInterface.model_construct(
                 **{
                     "inputs": {
                         "question_key": question_val,
@@ -1035,7 +1315,7 @@ async def rag_faithfulness(
             value=None,
             error=Error(
                 message="Error during RAG Faithfulness evaluation",
-                stacktrace=str(traceback.format_exc()),
+                stacktrace=traceback.format_exc(),
             ),
         )
 
@@ -1049,8 +1329,7 @@ async def measure_context_coherence(
             "No OpenAI key was found. RAG evaluator requires a valid OpenAI API key to function. Please configure your OpenAI API and try again."
         )
 
-    # Initialize RAG evaluator to calculate context relevancy score
-    context_rel = ContextRelevancy(api_key=openai_api_key)
+    context_rel = _context_relevancy_evaluator(openai_api_key)
     eval_score = await context_rel._run_eval_async(
         output=input.inputs["answer_key"],
         input=input.inputs["question_key"],
@@ -1068,67 +1347,12 @@ async def rag_context_relevancy(
     lm_providers_keys: Dict[str, Any],  # pylint: disable=unused-argument
 ) -> Result:
     try:
-        if isinstance(output, str):
-            logging.error("'output' is most likely not BaseResponse.")
-            raise NotImplementedError(
-                "Please update the SDK to the latest version, which supports RAG evaluators."
-            )
-
-        # Get required keys for rag evaluator
-        mapping_keys = remove_trace_prefix(settings_values=settings_values)
-        question_key: Union[str, None] = mapping_keys.get("question_key", None)
-        answer_key: Union[str, None] = mapping_keys.get("answer_key", None)
-        contexts_key: Union[str, None] = mapping_keys.get("contexts_key", None)
-
-        if None in [question_key, answer_key, contexts_key]:
-            logging.error(
-                f"Missing evaluator settings ? {['question', question_key is None, 'answer', answer_key is None, 'context', contexts_key is None]}"
-            )
-            raise ValueError(
-                "Missing required configuration keys: 'question_key', 'answer_key', or 'contexts_key'. Please check your evaluator settings and try again."
-            )
-
-        # Turn distributed trace into trace tree
-        trace = {}
-        version = output.get("version")
-        if version == "3.0":
-            trace = output.get("tree", {})
-        elif version == "2.0":
-            trace = output.get("trace", {})
-
-        trace = process_distributed_trace_into_trace_tree(trace, version)
-
-        # Get value of required keys for rag evaluator
-        question_val: Any = get_field_value_from_trace_tree(
-            trace, question_key, version
+        question_val, answer_val, contexts_val = _extract_rag_fields(
+            output, settings_values
         )
-        answer_val: Any = get_field_value_from_trace_tree(trace, answer_key, version)
-        contexts_val: Any = get_field_value_from_trace_tree(
-            trace, contexts_key, version
-        )
-
-        if None in [question_val, answer_val, contexts_val]:
-            logging.error(
-                f"Missing trace field ? {['question', question_val is None, 'answer', answer_val is None, 'context', contexts_val is None]}"
-            )
-
-            message = ""
-            if question_val is None:
-                message += (
-                    f"'question_key' is set to {question_key} which can't be found. "
-                )
-            if answer_val is None:
-                message += f"'answer_key' is set to {answer_key} which can't be found. "
-            if contexts_val is None:
-                message += (
-                    f"'contexts_key' is set to {contexts_key} which can't be found. "
-                )
-            message += "Please check your evaluator settings and try again."
-
-            raise ValueError(message)
 
         measurement = await measure_context_coherence(
-            input=EvaluatorInputInterface(
+            input=EvaluatorInputInterface.model_construct(
                 **{
                     "inputs": {
                         "question_key": question_val,
@@ -1148,31 +1372,67 @@ async def rag_context_relevancy(
             value=None,
             error=Error(
                 message="Error during RAG Context Relevancy evaluation",
-                stacktrace=str(traceback.format_exc()),
+                stacktrace=traceback.format_exc(),
             ),
         )
 
 
+def _levenshtein(prediction: str, ground_truth: str) -> int:
+    """
+    Pure-Python Levenshtein distance, used when rapidfuzz is unavailable.
+
+    Implements the Myers bit-parallel recurrence: each text character is
+    processed with a fixed number of bitwise operations over a word holding
+    one bit per pattern position, instead of an inner per-cell loop. Python
+    ints are arbitrary precision, so a single word covers any pattern length.
+    """
+
+    # The distance is symmetric; keep the shorter string as the pattern so
+    # the bit word stays as narrow as possible.
+    if len(prediction) > len(ground_truth):
+        prediction, ground_truth = ground_truth, prediction
+
+    m = len(prediction)
+    if m == 0:
+        return len(ground_truth)
+
+    peq: Dict[str, int] = {}
+    for i, char in enumerate(prediction):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    vp = mask
+    vn = 0
+    score = m
+    for char in ground_truth:
+        eq = peq.get(char, 0)
+        d0 = ((((eq & vp) + vp) & mask) ^ vp) | eq | vn
+        hp = vn | (~(d0 | vp) & mask)
+        hn = d0 & vp
+        if hp & high:
+            score += 1
+        if hn & high:
+            score -= 1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = hn | (~(d0 | hp) & mask)
+        vn = hp & d0
+
+    return score
+
+
 async def levenshtein_distance(
     input: EvaluatorInputInterface,
 ) -> EvaluatorOutputInterface:
     prediction = input.inputs["prediction"]
     ground_truth = input.inputs["ground_truth"]
 
-    if len(ground_truth) == 0:
-        return len(prediction)
-
-    previous_row = range(len(ground_truth) + 1)
-    for i, c1 in enumerate(prediction):
-        current_row = [i + 1]
-        for j, c2 in enumerate(ground_truth):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
+    if Levenshtein is not None:
+        distance = Levenshtein.distance(prediction, ground_truth)
+    else:
+        distance = _levenshtein(prediction, ground_truth)
 
-    distance = previous_row[-1]
     if "threshold" in input.settings:
         threshold = input.settings["threshold"]
         is_within_threshold = distance <= threshold
@@ -1181,6 +1441,7 @@ async def levenshtein_distance(
     return {"outputs": {"score": distance}}
 
 
+@_handle_evaluator_errors("Error during Levenshtein threshold evaluation")
 async def auto_levenshtein_distance(
     inputs: Dict[str, Any],  # pylint: disable=unused-argument
     output: Union[str, Dict[str, Any]],
@@ -1189,40 +1450,22 @@ async def auto_levenshtein_distance(
     settings_values: Dict[str, Any],
     lm_providers_keys: Dict[str, Any],  # pylint: disable=unused-argument
 ) -> Result:
-    try:
-        output = validate_string_output("levenshtein_distance", output)
-        correct_answer = get_correct_answer(data_point, settings_values)
-        response = await levenshtein_distance(
-            input=EvaluatorInputInterface(
-                **{
-                    "inputs": {"prediction": output, "ground_truth": correct_answer},
-                    "settings": settings_values,
-                }
-            )
-        )
-        if "success" in response["outputs"]:
-            return Result(type="number", value=response["outputs"]["success"])
-        return Result(type="number", value=response["outputs"]["score"])
-
-    except ValueError as e:
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message=str(e),
-            ),
-        )
-    except Exception as e:  # pylint: disable=broad-except
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message="Error during Levenshtein threshold evaluation",
-                stacktrace=str(traceback.format_exc()),
-            ),
+    output = validate_string_output("levenshtein_distance", output)
+    correct_answer = get_correct_answer(data_point, settings_values)
+    response = await levenshtein_distance(
+        input=EvaluatorInputInterface.model_construct(
+            **{
+                "inputs": {"prediction": output, "ground_truth": correct_answer},
+                "settings": settings_values,
+            }
         )
+    )
+    if "success" in response["outputs"]:
+        return Result(type="number", value=response["outputs"]["success"])
+    return Result(type="number", value=response["outputs"]["score"])
 
 
+@_handle_evaluator_errors("Error during Auto Similarity Match evaluation")
 async def auto_similarity_match(
     inputs: Dict[str, Any],
     output: Union[str, Dict[str, Any]],
@@ -1231,49 +1474,67 @@ async def auto_similarity_match(
     settings_values: Dict[str, Any],
     lm_providers_keys: Dict[str, Any],
 ) -> Result:
-    try:
-        output = validate_string_output("similarity_match", output)
-        correct_answer = get_correct_answer(data_point, settings_values)
-        response = await similarity_match(
-            input=EvaluatorInputInterface(
-                **{
-                    "inputs": {"prediction": output, "ground_truth": correct_answer},
-                    "settings": settings_values,
-                }
-            )
-        )
-        result = Result(type="bool", value=response["outputs"]["success"])
-        return result
-    except ValueError as e:
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message=str(e),
-            ),
-        )
-    except Exception as e:  # pylint: disable=broad-except
-        return Result(
-            type="error",
-            value=None,
-            error=Error(
-                message="Error during Auto Similarity Match evaluation",
-                stacktrace=str(traceback.format_exc()),
-            ),
+    output = validate_string_output("similarity_match", output)
+    correct_answer = get_correct_answer(data_point, settings_values)
+    response = await similarity_match(
+        input=EvaluatorInputInterface.model_construct(
+            **{
+                "inputs": {"prediction": output, "ground_truth": correct_answer},
+                "settings": settings_values,
+            }
         )
+    )
+    return Result(type="bool", value=response["outputs"]["success"])
 
 
 async def similarity_match(input: EvaluatorInputInterface) -> EvaluatorOutputInterface:
     set1 = set(input.inputs["prediction"].split())
     set2 = set(input.inputs["ground_truth"].split())
-    intersect = set1.intersection(set2)
-    union = set1.union(set2)
+    intersect = len(set1 & set2)
+    union = len(set1) + len(set2) - intersect
 
-    similarity = len(intersect) / len(union)
-    is_similar = True if similarity > input.settings["similarity_threshold"] else False
+    similarity = intersect / union if union else 0.0
+    is_similar = similarity > input.settings["similarity_threshold"]
     return {"outputs": {"success": is_similar}}
 
 
+def similarity_match_batch(
+    predictions: List[str],
+    ground_truths: List[str],
+    similarity_threshold: float,
+) -> List[bool]:
+    """
+    Jaccard-match many aligned (prediction, ground_truth) pairs in one pass,
+    without the per-row evaluate() dispatch and Result packaging.
+    """
+
+    results = []
+    for prediction, ground_truth in zip(predictions, ground_truths):
+        set1 = set(prediction.split())
+        set2 = set(ground_truth.split())
+        intersect = len(set1 & set2)
+        union = len(set1) + len(set2) - intersect
+        similarity = intersect / union if union else 0.0
+        results.append(similarity > similarity_threshold)
+    return results
+
+
+def levenshtein_distance_batch(
+    predictions: List[str],
+    ground_truths: List[str],
+) -> List[int]:
+    """
+    Levenshtein distances for many aligned pairs, using the rapidfuzz C
+    scorer when available and the bit-parallel fallback otherwise.
+    """
+
+    distance = Levenshtein.distance if Levenshtein is not None else _levenshtein
+    return [
+        distance(prediction, ground_truth)
+        for prediction, ground_truth in zip(predictions, ground_truths)
+    ]
+
+
 async def semantic_similarity(
     input: EvaluatorInputInterface,
 ) -> EvaluatorOutputInterface:
@@ -1292,21 +1553,107 @@ async def semantic_similarity(
             "No OpenAI key was found. Semantic evaluator requires a valid OpenAI API key to function. Please configure your OpenAI API and try again."
         )
 
-    openai = AsyncOpenAI(api_key=openai_api_key)
+    openai = _async_openai_client(openai_api_key)
+
+    output_vector, correct_answer_vector = await _encode_many(
+        openai, [input.inputs["prediction"], input.inputs["ground_truth"]]
+    )
+    similarity_score = float(output_vector @ correct_answer_vector)
+    return {"outputs": {"score": similarity_score}}
+
+
+_EMBEDDING_MODEL = "text-embedding-3-small"
+_EMBEDDING_CACHE_MAX_ENTRIES = 8192
+
+# LRU of embedding vectors keyed by (model, sha256(text)). Evaluation sets
+# repeat the same ground truth across many rows, so hits are common within a
+# run. Hashing keeps the keys small regardless of text length.
+_embedding_cache: "OrderedDict[Tuple[str, bytes], np.ndarray]" = OrderedDict()
+
+
+def _embedding_cache_key(model: str, text: str) -> Tuple[str, bytes]:
+    return (model, hashlib.sha256(text.encode("utf-8")).digest())
+
 
-    async def encode(text: str):
+def _quantize_embedding(vector: List[float]) -> np.ndarray:
+    """
+    Quantize an embedding to int8 for caching.
+
+    Components of the API's unit vectors lie well inside [-1, 1], so scaling
+    by 127 and rounding keeps the per-component error under 1/254; for the
+    cosine scores computed from these vectors the deviation stays below ~0.5%,
+    far inside any practical similarity threshold. int8 storage fits 8x more
+    vectors in the LRU than the float64 lists the API client hands back.
+    """
+
+    scaled = np.round(np.asarray(vector, dtype=np.float32) * 127.0)
+    return np.clip(scaled, -127, 127).astype(np.int8)
+
+
+async def _encode_many(openai: AsyncOpenAI, texts: List[str]) -> np.ndarray:
+    """
+    Embed a list of texts in a single Embeddings API call, returning an array
+    of shape (len(texts), D).
+
+    Cached vectors are served from the in-process LRU; the remaining misses
+    are coalesced into one request. The cache holds int8-quantized vectors
+    (see _quantize_embedding for the error bound) and the result is returned
+    as float32: the API already L2-normalizes the embeddings and the scores
+    only need a few significant digits.
+    """
+
+    keys = [_embedding_cache_key(_EMBEDDING_MODEL, text) for text in texts]
+    misses: Dict[Tuple[str, bytes], str] = {
+        key: text
+        for key, text in zip(keys, texts)
+        if key not in _embedding_cache
+    }
+
+    if misses:
         response = await openai.embeddings.create(
-            model="text-embedding-3-small", input=text
+            model=_EMBEDDING_MODEL, input=list(misses.values())
         )
-        return np.array(response.data[0].embedding)
+        for key, item in zip(misses, response.data):
+            _embedding_cache[key] = _quantize_embedding(item.embedding)
+        while len(_embedding_cache) > _EMBEDDING_CACHE_MAX_ENTRIES:
+            _embedding_cache.popitem(last=False)
+
+    vectors = []
+    for key in keys:
+        vector = _embedding_cache[key]
+        _embedding_cache.move_to_end(key)
+        vectors.append(vector)
+    # Re-normalize after dequantization so identical texts still score
+    # exactly 1.0 despite the rounding noise.
+    dequantized = np.asarray(vectors, dtype=np.float32)
+    return dequantized / np.linalg.norm(dequantized, axis=1, keepdims=True)
+
+
+async def semantic_similarity_batch(
+    pairs: List[Tuple[str, str]],
+    credentials: Dict[str, Any],
+) -> List[float]:
+    """
+    Score many (prediction, ground_truth) pairs with one Embeddings API call.
 
-    def cosine_similarity(output_vector: array, correct_answer_vector: array) -> float:
-        return np.dot(output_vector, correct_answer_vector)
+    All texts are flattened into a single request, and the cosine similarities
+    are computed in one vectorized pass over the stacked embeddings.
+    """
 
-    output_vector = await encode(input.inputs["prediction"])
-    correct_answer_vector = await encode(input.inputs["ground_truth"])
-    similarity_score = cosine_similarity(output_vector, correct_answer_vector)
-    return {"outputs": {"score": similarity_score}}
+    openai_api_key = credentials.get("OPENAI_API_KEY", None)
+    if not openai_api_key:
+        raise Exception(
+            "No OpenAI key was found. Semantic evaluator requires a valid OpenAI API key to function. Please configure your OpenAI API and try again."
+        )
+    if not pairs:
+        return []
+
+    openai = _async_openai_client(openai_api_key)
+    flattened = [text for pair in pairs for text in pair]
+    vectors = await _encode_many(openai, flattened)
+    predictions = vectors[0::2]
+    ground_truths = vectors[1::2]
+    return np.einsum("ij,ij->i", predictions, ground_truths).tolist()
 
 
 async def auto_semantic_similarity(
@@ -1322,7 +1669,7 @@ async def auto_semantic_similarity(
         correct_answer = get_correct_answer(data_point, settings_values)
         inputs = {"prediction": output, "ground_truth": correct_answer}
         response = await semantic_similarity(
-            input=EvaluatorInputInterface(
+            input=EvaluatorInputInterface.model_construct(
                 **{
                     "inputs": inputs,
                     "credentials": lm_providers_keys,
@@ -1336,7 +1683,7 @@ async def auto_semantic_similarity(
             value=None,
             error=Error(
                 message="Error during Auto Semantic Similarity",
-                stacktrace=str(traceback.format_exc()),
+                stacktrace=traceback.format_exc(),
             ),
         )
 
@@ -1362,6 +1709,187 @@ EVALUATOR_FUNCTIONS = {
     "rag_context_relevancy": rag_context_relevancy,
 }
 
+# The registries are constant after import: freeze them so accidental
+# mutation fails loudly, and intern the keys so the per-row lookups hit
+# the identity-compare fast path.
+EVALUATOR_FUNCTIONS = MappingProxyType(
+    {sys.intern(key): value for key, value in EVALUATOR_FUNCTIONS.items()}
+)
+
+
+def _ai_critique_batch_body(input: EvaluatorInputInterface) -> Dict[str, Any]:
+    """Build the chat-completions body for one AI Critique row."""
+
+    if (input.settings.get("version", "1") == "2") and (
+        type(input.settings.get("prompt_template", "")) is not str
+    ):
+        raise ValueError(
+            "AI Critique configurations with version 2 prompt templates are not supported in batched execution. Please run this evaluator through the online path instead."
+        )
+
+    chain_run_args = {
+        "llm_app_prompt_template": input.inputs.get("prompt_template", ""),
+        "variant_output": input.inputs["prediction"],
+        "correct_answer": input.inputs["ground_truth"],
+    }
+    for key, value in input.inputs.items():
+        chain_run_args[key] = value
+
+    prompt_template = input.settings.get("prompt_template", "")
+    return {
+        "model": input.settings.get("model", "gpt-3.5-turbo"),
+        "messages": [
+            {"role": "system", "content": prompt_template},
+            {"role": "user", "content": str(chain_run_args)},
+        ],
+        "temperature": 0.8,
+    }
+
+
+def _ai_critique_batch_result(response_body: Dict[str, Any]) -> Result:
+    score = response_body["choices"][0]["message"]["content"].strip()
+    return Result(type="text", value=str(score))
+
+
+def _semantic_similarity_batch_body(input: EvaluatorInputInterface) -> Dict[str, Any]:
+    """Embed prediction and ground truth together in a single request."""
+
+    return {
+        "model": "text-embedding-3-small",
+        "input": [input.inputs["prediction"], input.inputs["ground_truth"]],
+    }
+
+
+def _semantic_similarity_batch_result(response_body: Dict[str, Any]) -> Result:
+    output_vector = np.asarray(response_body["data"][0]["embedding"])
+    correct_answer_vector = np.asarray(response_body["data"][1]["embedding"])
+    return Result(type="number", value=float(output_vector @ correct_answer_vector))
+
+
+# Evaluators that can run through the OpenAI Batch API for offline runs:
+# evaluator key -> (endpoint, request-body builder, response-body mapper).
+# The RAG evaluators stay out of this registry because their scoring is
+# multi-step inside autoevals and cannot be expressed as one pre-serialized
+# request per row.
+EVALUATOR_BATCH_FUNCTIONS = {
+    "auto_ai_critique": (
+        "/v1/chat/completions",
+        _ai_critique_batch_body,
+        _ai_critique_batch_result,
+    ),
+    "auto_semantic_similarity": (
+        "/v1/embeddings",
+        _semantic_similarity_batch_body,
+        _semantic_similarity_batch_result,
+    ),
+}
+
+EVALUATOR_BATCH_FUNCTIONS = MappingProxyType(
+    {sys.intern(key): value for key, value in EVALUATOR_BATCH_FUNCTIONS.items()}
+)
+
+
+async def submit_batch(
+    evaluator_key: str,
+    rows: List[EvaluatorInputInterface],
+    credentials: Dict[str, Any],
+) -> str:
+    """
+    Submit an offline evaluation run through the OpenAI Batch API.
+
+    Serializes one request line per row, uploads the JSONL file, and creates
+    the batch. Batched runs trade latency for a 50% price discount, so they
+    only make sense for large offline jobs. Returns the batch id to poll with
+    collect_batch.
+    """
+
+    if evaluator_key not in EVALUATOR_BATCH_FUNCTIONS:
+        raise ValueError(
+            f"Evaluator {evaluator_key} does not support batched execution."
+        )
+    openai_api_key = credentials.get("OPENAI_API_KEY", None)
+    if not openai_api_key:
+        raise Exception(
+            "No OpenAI key was found. Batched evaluation requires a valid OpenAI API key to function. Please configure your OpenAI API and try again."
+        )
+
+    endpoint, build_body, _ = EVALUATOR_BATCH_FUNCTIONS[evaluator_key]
+    lines = [
+        json.dumps(
+            {
+                "custom_id": str(index),
+                "method": "POST",
+                "url": endpoint,
+                "body": build_body(row),
+            }
+        )
+        for index, row in enumerate(rows)
+    ]
+
+    client = _async_openai_client(openai_api_key)
+    # The Batch API requires the input file to be named *.jsonl; raw bytes
+    # would upload under an extensionless default name and be rejected.
+    batch_file = await client.files.create(
+        file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint=endpoint,
+        completion_window="24h",
+    )
+    return batch.id
+
+
+async def collect_batch(
+    evaluator_key: str,
+    batch_id: str,
+    credentials: Dict[str, Any],
+) -> Union[Dict[int, Result], None]:
+    """
+    Collect the results of a batch submitted with submit_batch.
+
+    Returns None while the batch is still running. Once it completes, returns
+    a mapping of row index to Result; rows the API failed on map to error
+    Results. Raises if the batch terminated without producing output.
+    """
+
+    openai_api_key = credentials.get("OPENAI_API_KEY", None)
+    if not openai_api_key:
+        raise Exception(
+            "No OpenAI key was found. Batched evaluation requires a valid OpenAI API key to function. Please configure your OpenAI API and try again."
+        )
+
+    client = _async_openai_client(openai_api_key)
+    batch = await client.batches.retrieve(batch_id)
+    if batch.status in ("validating", "in_progress", "finalizing"):
+        return None
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'.")
+
+    _, _, map_result = EVALUATOR_BATCH_FUNCTIONS[evaluator_key]
+    output_file = await client.files.content(batch.output_file_id)
+
+    results: Dict[int, Result] = {}
+    for line in output_file.text.splitlines():
+        if not line:
+            continue
+        entry = json.loads(line)
+        index = int(entry["custom_id"])
+        response = entry.get("response")
+        if response is None or response.get("status_code") != 200:
+            results[index] = Result(
+                type="error",
+                value=None,
+                error=Error(
+                    message=f"Batch request failed: {entry.get('error') or response}",
+                ),
+            )
+            continue
+        results[index] = map_result(response["body"])
+    return results
+
+
 RUN_EVALUATOR_FUNCTIONS = {
     "auto_exact_match": exact_match,
     "auto_regex_test": regex_test,
@@ -1383,6 +1911,10 @@ RUN_EVALUATOR_FUNCTIONS = {
     "rag_context_relevancy": measure_context_coherence,
 }
 
+RUN_EVALUATOR_FUNCTIONS = MappingProxyType(
+    {sys.intern(key): value for key, value in RUN_EVALUATOR_FUNCTIONS.items()}
+)
+
 
 async def evaluate(
     evaluator_key: str,
@@ -1393,8 +1925,9 @@ async def evaluate(
     settings_values: Dict[str, Any],
     lm_providers_keys: Dict[str, Any],
 ) -> Result:
-    evaluation_function = EVALUATOR_FUNCTIONS.get(evaluator_key, None)
-    if not evaluation_function:
+    try:
+        evaluation_function = EVALUATOR_FUNCTIONS[evaluator_key]
+    except KeyError:
         return Result(
             type="error",
             value=None,
@@ -1416,12 +1949,42 @@ async def evaluate(
             type="error",
             value=None,
             error=Error(
-                message="Error occurred while running {evaluator_key} evaluation. ",
+                message=f"Error occurred while running {evaluator_key} evaluation. ",
                 stacktrace=str(exc),
             ),
         )
 
 
+# Upper bound on concurrently running evaluators; most evaluators are
+# IO-bound (webhooks, LLM critiques) so fanning out overlaps their latency.
+_MAX_CONCURRENT_EVALUATIONS = 50
+
+
+async def evaluate_many(
+    evaluation_jobs: List[Dict[str, Any]],
+    max_concurrency: int = _MAX_CONCURRENT_EVALUATIONS,
+) -> List[Result]:
+    """
+    Run several evaluate() calls concurrently, bounded by a semaphore.
+
+    Args:
+        evaluation_jobs (List[Dict[str, Any]]): keyword-argument dicts, one per
+            evaluate() call, in the order results should be returned.
+        max_concurrency (int): maximum number of evaluators in flight at once.
+
+    Returns:
+        List[Result]: one result per job, in job order.
+    """
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded_evaluate(job: Dict[str, Any]) -> Result:
+        async with semaphore:
+            return await evaluate(**job)
+
+    return await asyncio.gather(*(bounded_evaluate(job) for job in evaluation_jobs))
+
+
 async def run(
     evaluator_key: str, evaluator_input: EvaluatorInputInterface
 ) -> EvaluatorOutputInterface:
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import traceback
 from typing import Any, Dict, List
@@ -41,6 +40,7 @@ from oss.src.services.db_manager import (
     check_if_evaluation_contains_failed_evaluation_scenarios,
 )
 from oss.src.services.evaluator_manager import get_evaluators
+from oss.src.utils.event_loop import run_coroutine
 
 
 # Set logger
@@ -90,11 +90,9 @@ def evaluate(
         None
     """
 
-    loop = asyncio.get_event_loop()
-
     try:
         # 0. Update evaluation status to STARTED
-        loop.run_until_complete(
+        run_coroutine(
             update_evaluation(
                 evaluation_id,
                 project_id,
@@ -107,21 +105,21 @@ def evaluate(
         )
 
         # 1. Fetch data from the database
-        app = loop.run_until_complete(fetch_app_by_id(app_id))
-        app_variant_db = loop.run_until_complete(fetch_app_variant_by_id(variant_id))
+        app = run_coroutine(fetch_app_by_id(app_id))
+        app_variant_db = run_coroutine(fetch_app_variant_by_id(variant_id))
         assert (
             app_variant_db is not None
         ), f"App variant with id {variant_id} not found!"
         app_variant_parameters = app_variant_db.config_parameters
-        testset_db = loop.run_until_complete(fetch_testset_by_id(testset_id))
+        testset_db = run_coroutine(fetch_testset_by_id(testset_id))
         evaluator_config_dbs = []
         for evaluator_config_id in evaluators_config_ids:
-            evaluator_config = loop.run_until_complete(
+            evaluator_config = run_coroutine(
                 fetch_evaluator_config(evaluator_config_id)
             )
             evaluator_config_dbs.append(evaluator_config)
 
-        deployment_db = loop.run_until_complete(
+        deployment_db = run_coroutine(
             get_deployment_by_id(str(app_variant_db.base.deployment_id))
         )
         uri = deployment_manager.get_deployment_uri(uri=deployment_db.uri)  # type: ignore
@@ -136,7 +134,7 @@ def evaluate(
         }
 
         # 3. Invoke the app
-        app_outputs: List[InvokationResult] = loop.run_until_complete(
+        app_outputs: List[InvokationResult] = run_coroutine(
             llm_apps_service.batch_invoke(
                 uri,
                 testset_db.csvdata,  # type: ignore
@@ -154,13 +152,13 @@ def evaluate(
         secret_token = None
         headers = None
         if isCloudEE():
-            secret_token = loop.run_until_complete(
+            secret_token = run_coroutine(
                 sign_secret_token(user_id, project_id, None)
             )
             if secret_token:
                 headers = {"Authorization": f"Secret {secret_token}"}
 
-        openapi_parameters = loop.run_until_complete(
+        openapi_parameters = run_coroutine(
             llm_apps_service.get_parameters_from_openapi(
                 uri + "/openapi.json",
                 headers,
@@ -208,7 +206,7 @@ def evaluate(
                     for evaluator_config_db in evaluator_config_dbs
                 ]
 
-                loop.run_until_complete(
+                run_coroutine(
                     create_new_evaluation_scenario(
                         project_id=project_id,
                         evaluation_id=evaluation_id,
@@ -237,8 +235,10 @@ def evaluate(
             # 3. We evaluate
             evaluators_results: List[EvaluationScenarioResult] = []
 
-            # Loop over each evaluator configuration to gather the correct answers and evaluate
+            # Loop over each evaluator configuration to gather the correct answers,
+            # then run all the evaluators for this data point concurrently
             ground_truth_column_names = []
+            evaluation_jobs = []
             for evaluator_config_db in evaluator_config_dbs:
                 ground_truth_keys = ground_truth_keys_dict.get(
                     evaluator_config_db.evaluator_key, []
@@ -249,8 +249,8 @@ def evaluate(
                 )
                 logger.debug(f"Evaluating with evaluator: {evaluator_config_db}")
 
-                result = loop.run_until_complete(
-                    evaluators_service.evaluate(
+                evaluation_jobs.append(
+                    dict(
                         evaluator_key=evaluator_config_db.evaluator_key,
                         output=app_output.result.value,
                         data_point=data_point,
@@ -261,6 +261,11 @@ def evaluate(
                     )
                 )
 
+            results = run_coroutine(
+                evaluators_service.evaluate_many(evaluation_jobs)
+            )
+
+            for evaluator_config_db, result in zip(evaluator_config_dbs, results):
                 # Update evaluators aggregated data
                 evaluator_results: List[Result] = evaluators_aggregated_data[
                     str(evaluator_config_db.id)
@@ -289,7 +294,7 @@ def evaluate(
             # 4. We save the result of the eval scenario in the db
             print("============ App Output ============: ", app_output.result.value)
 
-            loop.run_until_complete(
+            run_coroutine(
                 create_new_evaluation_scenario(
                     project_id=project_id,
                     evaluation_id=evaluation_id,
@@ -321,7 +326,7 @@ def evaluate(
         total_cost = aggregation_service.sum_float_from_llm_app_response(
             app_outputs, "cost"
         )
-        loop.run_until_complete(
+        run_coroutine(
             update_evaluation(
                 evaluation_id,
                 project_id,
@@ -336,7 +341,7 @@ def evaluate(
     except Exception as e:
         logger.error(f"An error occurred during evaluation: {e}")
         traceback.print_exc()
-        loop.run_until_complete(
+        run_coroutine(
             update_evaluation(
                 evaluation_id,
                 project_id,
@@ -356,15 +361,15 @@ def evaluate(
         return
 
     try:
-        aggregated_results = loop.run_until_complete(
+        aggregated_results = run_coroutine(
             aggregate_evaluator_results(evaluators_aggregated_data)
         )
 
-        loop.run_until_complete(
+        run_coroutine(
             update_evaluation_with_aggregated_results(evaluation_id, aggregated_results)
         )
 
-        failed_evaluation_scenarios = loop.run_until_complete(
+        failed_evaluation_scenarios = run_coroutine(
             check_if_evaluation_contains_failed_evaluation_scenarios(evaluation_id)
         )
 
@@ -379,7 +384,7 @@ def evaluate(
                 error=None,
             )
 
-        loop.run_until_complete(
+        run_coroutine(
             update_evaluation(
                 evaluation_id=evaluation_id,
                 project_id=project_id,
@@ -390,7 +395,7 @@ def evaluate(
     except Exception as e:
         logger.error(f"An error occurred during evaluation aggregation: {e}")
         traceback.print_exc()
-        loop.run_until_complete(
+        run_coroutine(
             update_evaluation(
                 evaluation_id,
                 project_id,
@@ -0,0 +1,48 @@
+import asyncio
+import threading
+from typing import Any, Coroutine
+from concurrent.futures import Future
+
+
+_loop: asyncio.AbstractEventLoop = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Returns the shared background event loop, starting it on first use.
+
+    The loop runs forever on a daemon thread, so sync callers (such as celery
+    tasks) can schedule coroutines on it without repeatedly entering and
+    leaving an event loop of their own, and coroutines submitted from
+    different threads overlap their I/O on the one loop.
+
+    :return: the process-wide background event loop.
+    """
+
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="background-event-loop",
+                daemon=True,
+            )
+            thread.start()
+            _loop = loop
+    return _loop
+
+
+def submit_coroutine(coroutine: Coroutine) -> Future:
+    """Schedules a coroutine on the shared background loop.
+
+    :return: a concurrent.futures.Future resolving to the coroutine's result.
+    """
+
+    return asyncio.run_coroutine_threadsafe(coroutine, _background_loop())
+
+
+def run_coroutine(coroutine: Coroutine) -> Any:
+    """Runs a coroutine on the shared background loop and waits for its result."""
+
+    return submit_coroutine(coroutine).result()
@@ -1,8 +1,10 @@
+import re
 import logging
 import traceback
 from copy import deepcopy
+from functools import lru_cache
 from collections import OrderedDict
-from typing import Any, Dict, Union, Optional
+from typing import Any, Dict, Tuple, Union, Optional
 
 
 logger = logging.getLogger(__name__)
@@ -326,25 +328,42 @@ def process_distributed_trace_into_trace_tree(trace: Any, version: str):
     return trace
 
 
-SPECIAL_KEYS = [
-    "inputs",
-    "internals",
-    "outputs",
-]
+SPECIAL_KEYS = frozenset(
+    [
+        "inputs",
+        "internals",
+        "outputs",
+    ]
+)
 
 SPANS_KEY = "spans"
 
+# Matches a single field part, e.g. "summarizer" or "summarizer[0]".
+_FIELD_RE = re.compile(r"([^\[\]]+)(?:\[(\d+)\])?")
+
+
+@lru_cache(maxsize=1024)
+def _tokenize_field_path(field: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """
+    Tokenize a dot-separated field path into (key, index) pairs, e.g.
+    "rag.summarizer[0].outputs.report" -> (("rag", None), ("summarizer", 0), ...).
+
+    The result is cached since evaluators resolve the same handful of field
+    paths for every row of a test set.
+    """
+
+    return tuple(_parse_field_part(part) for part in field.split("."))
+
 
 def _parse_field_part(part):
-    key = part
-    idx = None
+    # Extract the key and the optional [idx] suffix in a single match
+    match = _FIELD_RE.fullmatch(part)
+    if match is None:
+        return part, None
 
-    # Check if part is indexed, if so split it
-    if "[" in part and "]" in part:
-        key = part.split("[")[0]
-        idx = int(part.split("[")[1].split("]")[0])
+    idx = match.group(2)
 
-    return key, idx
+    return match.group(1), int(idx) if idx is not None else None
 
 
 # --------------------------------------------------------------- #
@@ -384,13 +403,9 @@ def get_field_value_from_trace_tree_v2(
 
     separate_by_spans_key = True
 
-    parts = field.split(".")
-
     try:
-        for part in parts:
-            # by default, expects something like 'retriever'
-            key, idx = _parse_field_part(part)
-
+        # by default, each part is something like 'retriever'
+        for key, idx in _tokenize_field_path(field):
             # before 'SPECIAL_KEYS', spans are nested within a 'spans' key
             # e.g. trace["spans"]["rag"]["spans"]["retriever"]...
             if key in SPECIAL_KEYS:
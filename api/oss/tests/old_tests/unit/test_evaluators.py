@@ -1,11 +1,20 @@
 import os
+import json
+from types import SimpleNamespace
+
 import pytest
 
 from oss.src.tests.unit.test_traces import (
     simple_rag_trace,
     simple_rag_trace_for_baseresponse_v3,
 )
+from oss.src.services import evaluators_service
+from oss.src.models.api.evaluation_model import EvaluatorInputInterface
 from oss.src.services.evaluators_service import (
+    _ai_critique_batch_body,
+    _semantic_similarity_batch_body,
+    _semantic_similarity_batch_result,
+    submit_batch,
     auto_levenshtein_distance,
     auto_ai_critique,
     auto_starts_with,
@@ -634,3 +643,113 @@ async def test_rag_context_relevancy_evaluator_for_baseresponse_v3(
         # - raised by evaluator (agenta) -> TypeError
         assert not isinstance(result.value, float) or not isinstance(result.value, int)
         assert result.error.message == "Error during RAG Context Relevancy evaluation"
+
+
+@pytest.mark.parametrize(
+    "settings_values, expected_model, expected_system_content",
+    [
+        (
+            {"prompt_template": "Grade the answer from 0 to 10."},
+            "gpt-3.5-turbo",
+            "Grade the answer from 0 to 10.",
+        ),
+        (
+            {"prompt_template": "Grade it.", "model": "gpt-4o-mini"},
+            "gpt-4o-mini",
+            "Grade it.",
+        ),
+    ],
+)
+def test_ai_critique_batch_body(settings_values, expected_model, expected_system_content):
+    body = _ai_critique_batch_body(
+        EvaluatorInputInterface(
+            inputs={"prediction": "output", "ground_truth": "answer"},
+            settings=settings_values,
+        )
+    )
+    assert body["model"] == expected_model
+    assert body["messages"][0] == {"role": "system", "content": expected_system_content}
+    assert body["messages"][1]["role"] == "user"
+
+
+def test_ai_critique_batch_body_rejects_v2_message_templates():
+    with pytest.raises(ValueError):
+        _ai_critique_batch_body(
+            EvaluatorInputInterface(
+                inputs={"prediction": "output", "ground_truth": "answer"},
+                settings={
+                    "version": "2",
+                    "prompt_template": [{"role": "system", "content": "Grade it."}],
+                },
+            )
+        )
+
+
+def test_semantic_similarity_batch_roundtrip():
+    body = _semantic_similarity_batch_body(
+        EvaluatorInputInterface(
+            inputs={"prediction": "output", "ground_truth": "answer"}
+        )
+    )
+    assert body == {
+        "model": "text-embedding-3-small",
+        "input": ["output", "answer"],
+    }
+
+    result = _semantic_similarity_batch_result(
+        {"data": [{"embedding": [1.0, 0.0]}, {"embedding": [0.6, 0.8]}]}
+    )
+    assert result.type == "number"
+    assert result.value == pytest.approx(0.6)
+
+
+@pytest.mark.asyncio
+async def test_submit_batch_uploads_named_jsonl(monkeypatch):
+    uploads = []
+    created_batches = []
+
+    class FakeFiles:
+        async def create(self, file, purpose):
+            uploads.append((file, purpose))
+            return SimpleNamespace(id="file-123")
+
+    class FakeBatches:
+        async def create(self, input_file_id, endpoint, completion_window):
+            created_batches.append((input_file_id, endpoint, completion_window))
+            return SimpleNamespace(id="batch-456")
+
+    class FakeClient:
+        files = FakeFiles()
+        batches = FakeBatches()
+
+    monkeypatch.setattr(
+        evaluators_service, "_async_openai_client", lambda api_key: FakeClient()
+    )
+
+    rows = [
+        EvaluatorInputInterface(
+            inputs={"prediction": f"output {index}", "ground_truth": "answer"},
+            settings={"prompt_template": "Grade it."},
+        )
+        for index in range(2)
+    ]
+    batch_id = await submit_batch(
+        "auto_ai_critique", rows, {"OPENAI_API_KEY": "test-key"}
+    )
+
+    assert batch_id == "batch-456"
+    assert created_batches == [("file-123", "/v1/chat/completions", "24h")]
+
+    (file, purpose) = uploads[0]
+    assert purpose == "batch"
+    # The Batch API requires a *.jsonl filename; raw bytes are rejected.
+    filename, payload = file
+    assert filename.endswith(".jsonl")
+    lines = payload.decode("utf-8").splitlines()
+    assert len(lines) == len(rows)
+    for index, line in enumerate(lines):
+        entry = json.loads(line)
+        assert entry["custom_id"] == str(index)
+        assert entry["method"] == "POST"
+        assert entry["url"] == "/v1/chat/completions"
+        assert entry["body"]["messages"][0]["content"] == "Grade it."